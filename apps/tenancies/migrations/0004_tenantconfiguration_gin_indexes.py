@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-14 04:06
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenancies", "0003_department_is_active_tenant_is_active_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tenantconfiguration",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["branding"],
+                name="idx_tenant_cfg_branding_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tenantconfiguration",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["settings"],
+                name="idx_tenant_cfg_settings_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,142 @@
+# Generated by Django 5.2.18 on 2026-10-14 04:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("tenancies", "0004_tenantconfiguration_gin_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="department",
+            name="idx_departments_tenant_id",
+        ),
+        RemoveIndexConcurrently(
+            model_name="role",
+            name="idx_roles_tenant_id",
+        ),
+        RemoveIndexConcurrently(
+            model_name="userdepartmentrole",
+            name="idx_dept_users_user_id",
+        ),
+        RemoveIndexConcurrently(
+            model_name="usertenantrole",
+            name="idx_u_user_tenant_roles_id",
+        ),
+        # Only the implicit FK indexes are dropped. A plain AlterField would
+        # also drop and re-create (and re-validate) each FK constraint.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS departments_tenant_id_680bbe49",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS departments_tenant_id_680bbe49 ON departments (tenant_id)",
+                ),
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS roles_tenant_id_2f74b73b",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS roles_tenant_id_2f74b73b ON roles (tenant_id)",
+                ),
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS role_permissions_role_id_216516f2",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS role_permissions_role_id_216516f2 ON role_permissions (role_id)",
+                ),
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS user_department_roles_department_id_6b2834c6",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS user_department_roles_department_id_6b2834c6 ON user_department_roles (department_id)",
+                ),
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS user_department_roles_user_id_79c8b716",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS user_department_roles_user_id_79c8b716 ON user_department_roles (user_id)",
+                ),
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS user_tenant_roles_tenant_id_bc9aa41a",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS user_tenant_roles_tenant_id_bc9aa41a ON user_tenant_roles (tenant_id)",
+                ),
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS user_tenant_roles_user_id_ec7029ca",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS user_tenant_roles_user_id_ec7029ca ON user_tenant_roles (user_id)",
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="department",
+                    name="tenant",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tenancies.tenant",
+                        verbose_name="tenant",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="role",
+                    name="tenant",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        help_text="Null for global system roles.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="roles",
+                        to="tenancies.tenant",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="rolepermission",
+                    name="role",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tenancies.role",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="userdepartmentrole",
+                    name="department",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tenancies.department",
+                        verbose_name="department",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="userdepartmentrole",
+                    name="user",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="usertenantrole",
+                    name="tenant",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tenancies.tenant",
+                        verbose_name="tenant",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="usertenantrole",
+                    name="user",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+        ),
+    ]
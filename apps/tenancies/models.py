@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -91,6 +92,19 @@ class TenantConfiguration(TimestampedModel):
         db_table = "tenant_configurations"
         verbose_name = _("tenant configuration")
         verbose_name_plural = _("tenant configurations")
+        # For future containment (@>) lookups; nothing queries these yet.
+        indexes = [
+            GinIndex(
+                fields=["branding"],
+                name="idx_tenant_cfg_branding_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+            GinIndex(
+                fields=["settings"],
+                name="idx_tenant_cfg_settings_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ]
 
 
 class Role(TimestampedModel):
@@ -105,6 +119,7 @@ class Role(TimestampedModel):
         on_delete=models.CASCADE,
         null=True,
         related_name="roles",
+        db_index=False,  # covered by unique_together ("tenant", "name")
         help_text=_("Null for global system roles."),
     )
     name = models.CharField(_("name"), max_length=100)
@@ -125,9 +140,6 @@ class Role(TimestampedModel):
         verbose_name = _("role")
         verbose_name_plural = _("roles")
         unique_together = [["tenant", "name"]]
-        indexes = [
-            models.Index(fields=["tenant"], name="idx_roles_tenant_id"),
-        ]
 
 
 class RolePermission(models.Model):
@@ -136,7 +148,9 @@ class RolePermission(models.Model):
     Corresponds to the 'role_permissions' table.
     """
 
-    role = models.ForeignKey(Role, on_delete=models.CASCADE)
+    role = models.ForeignKey(
+        Role, on_delete=models.CASCADE, db_index=False
+    )  # covered by unique_together ("role", "permission")
     permission = models.ForeignKey(Permission, on_delete=models.CASCADE)
 
     class Meta:
@@ -151,11 +165,14 @@ class UserTenantRole(models.Model):
     """
 
     user = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name=_("user")
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        db_index=False,  # covered by unique_together ("user", "tenant", "role")
+        verbose_name=_("user"),
     )
     tenant = models.ForeignKey(
-        Tenant, on_delete=models.CASCADE, verbose_name=_("tenant")
-    )
+        Tenant, on_delete=models.CASCADE, db_index=False, verbose_name=_("tenant")
+    )  # indexed by idx_t_user_tenant_roles_id
     role = models.ForeignKey(
         Role, on_delete=models.PROTECT, verbose_name=_("role")
     )  # PROTECT = ON DELETE RESTRICT
@@ -166,7 +183,6 @@ class UserTenantRole(models.Model):
         verbose_name_plural = _("user roles in tenant")
         unique_together = [["user", "tenant", "role"]]
         indexes = [
-            models.Index(fields=["user"], name="idx_u_user_tenant_roles_id"),
             models.Index(fields=["tenant"], name="idx_t_user_tenant_roles_id"),
         ]
 
@@ -178,8 +194,8 @@ class Department(BaseAuditModel):
     """
 
     tenant = models.ForeignKey(
-        Tenant, on_delete=models.CASCADE, verbose_name=_("tenant")
-    )
+        Tenant, on_delete=models.CASCADE, db_index=False, verbose_name=_("tenant")
+    )  # covered by unique_together ("tenant", "name")
     parent_department = models.ForeignKey(
         "self",
         on_delete=models.SET_NULL,
@@ -205,9 +221,6 @@ class Department(BaseAuditModel):
         verbose_name = _("department")
         verbose_name_plural = _("departments")
         unique_together = [["tenant", "name"]]
-        indexes = [
-            models.Index(fields=["tenant"], name="idx_departments_tenant_id"),
-        ]
 
 
 class UserDepartmentRole(models.Model):
@@ -217,11 +230,17 @@ class UserDepartmentRole(models.Model):
     """
 
     user = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name=_("user")
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        db_index=False,  # covered by unique_together ("user", "department", "role")
+        verbose_name=_("user"),
     )
     department = models.ForeignKey(
-        Department, on_delete=models.CASCADE, verbose_name=_("department")
-    )
+        Department,
+        on_delete=models.CASCADE,
+        db_index=False,
+        verbose_name=_("department"),
+    )  # indexed by idx_dept_users_dept_id
     role = models.ForeignKey(Role, on_delete=models.PROTECT, verbose_name=_("role"))
 
     class Meta:
@@ -232,6 +251,5 @@ class UserDepartmentRole(models.Model):
             ["user", "department", "role"],
         ]
         indexes = [
-            models.Index(fields=["user"], name="idx_dept_users_user_id"),
             models.Index(fields=["department"], name="idx_dept_users_dept_id"),
         ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-14 04:08
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("tenancies", "0005_drop_redundant_indexes"),
+        ("users", "0002_alter_user_deleted_at_alter_user_is_active"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="user",
+            name="idx_users_tenant_id",
+        ),
+        # Only the implicit FK indexes are dropped. A plain AlterField would
+        # also drop and re-create (and re-validate) each FK constraint.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="DROP INDEX CONCURRENTLY IF EXISTS users_tenant_id_07f315ee",
+                    reverse_sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS users_tenant_id_07f315ee ON users (tenant_id)",
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="user",
+                    name="tenant",
+                    field=models.ForeignKey(
+                        blank=True,
+                        db_index=False,
+                        help_text="The tenant the user belongs to. Null for system superadmins.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tenancies.tenant",
+                        verbose_name="tenant",
+                    ),
+                ),
+            ],
+        ),
+    ]
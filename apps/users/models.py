@@ -23,6 +23,7 @@ class User(AbstractBaseUser, BaseAuditModel, PermissionsMixin):
         verbose_name=_("tenant"),
         null=True,
         blank=True,
+        db_index=False,  # covered by unique_together ("tenant", "email")
         help_text=_("The tenant the user belongs to. Null for system superadmins."),
     )
     email = models.EmailField(_("email"), max_length=255, unique=True)
@@ -49,7 +50,6 @@ class User(AbstractBaseUser, BaseAuditModel, PermissionsMixin):
         verbose_name_plural = _("users")
         unique_together = [["tenant", "email"]]
         indexes = [
-            models.Index(fields=["tenant"], name="idx_users_tenant_id"),
             models.Index(
                 fields=["tenant", "is_active"], name="idx_users_tenant_id_is_active"
             ),
@@ -66,8 +66,8 @@ class User(AbstractBaseUser, BaseAuditModel, PermissionsMixin):
         """
         Returns a queryset of all tenants the user is associated with
         through the UserTenantRole model.
-        It uses distinct() to avoid duplicates if a user has multiple
-        roles in the same tenant.
+        The tenants are joined directly against user_tenant_roles, and
+        distinct() avoids duplicates if a user has multiple roles in the
+        same tenant.
         """
-        tenant_ids = self.usertenantrole_set.values_list("tenant_id", flat=True)
-        return Tenant.objects.filter(id__in=tenant_ids).distinct()
+        return Tenant.objects.filter(usertenantrole__user=self).distinct()
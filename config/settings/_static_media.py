@@ -2,6 +2,8 @@ from pathlib import Path
 
 from decouple import config
 
+_BASE = Path(__file__).resolve().parents[3]
+
 STATIC_URL = config("STATIC_URL", default="static/")
 MEDIA_URL = "/media/"
-MEDIA_ROOT = Path(__file__).resolve().parent.parent.parent.parent / "media"
+MEDIA_ROOT = str(_BASE / "media")